@@ -7,6 +7,14 @@ import sys
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+
+# Largest line width libyaml accepts; disables folding of long scalars
+_YAML_NO_WRAP = 2**31 - 1
+
 
 class AnsibleEngine:
     """Engine for executing Ansible-based workflows using task files"""
@@ -41,7 +49,7 @@ class AnsibleEngine:
 
         try:
             with open(self.config_file, "r") as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=SafeLoader) or {}
         except Exception as e:
             print(f"Warning: Could not load config file {self.config_file}: {e}")
             return {}
@@ -128,16 +136,33 @@ class AnsibleEngine:
         Returns:
             List of task file names (without .yml extension)
         """
-        if not os.path.exists(self.tasks_dir):
-            return []
+        return list(self.list_task_files())
+
+    def list_task_files(self) -> Dict[str, str]:
+        """Map each available task name to its task file path
+
+        Uses a single directory scan; like get_task_file_path(), a .yml file
+        takes precedence over a .yaml file with the same name.
+
+        Returns:
+            Dict of task name to file path, sorted by task name
+        """
+        try:
+            with os.scandir(self.tasks_dir) as entries:
+                paths = {
+                    entry.name: entry.path
+                    for entry in entries
+                    if entry.name.endswith((".yml", ".yaml"))
+                }
+        except FileNotFoundError:
+            return {}
 
-        task_files = []
-        for file in os.listdir(self.tasks_dir):
-            if file.endswith(".yml") or file.endswith(".yaml"):
-                task_name = os.path.splitext(file)[0]
-                task_files.append(task_name)
+        task_files = {}
+        # ".yaml" sorts before ".yml", so the .yml path is written last
+        for file_name in sorted(paths):
+            task_files[os.path.splitext(file_name)[0]] = paths[file_name]
 
-        return sorted(task_files)
+        return dict(sorted(task_files.items()))
 
     def task_exists(self, task_name: str) -> bool:
         """Check if a task file exists
@@ -210,7 +235,13 @@ class AnsibleEngine:
             }
         ]
 
-        return yaml.dump(playbook_data, default_flow_style=False, sort_keys=False)
+        return yaml.dump(
+            playbook_data,
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            width=_YAML_NO_WRAP,
+        )
 
     def execute_task(
         self, task_name: str, variables: Dict[str, str] = None, verbose: bool = False
@@ -0,0 +1,1688 @@
+"""
+Command handlers for tool.py
+
+Each cmd_* function implements one subcommand and returns the process exit
+code. tool.py builds the argument parser and imports this module only once a
+command is actually run, so --help never pays for compiling it.
+"""
+
+import os
+import sys
+import io
+import functools
+import itertools
+import json
+import subprocess
+import logging
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Dict, Any
+
+from github_wrapper import GitHubWrapper, RepoInfo, read_remote_urls
+
+
+def cmd_whoami(args):
+    """Handle whoami subcommand"""
+    try:
+        gh = GitHubWrapper()
+        user_data = gh.whoami()
+
+        print(f"Authenticated as: {user_data['login']}")
+        print(f"Name: {user_data['name']}")
+        print(f"Email: {user_data.get('email', 'Not public')}")
+        print(f"Profile: {user_data.get('html_url', 'N/A')}")
+
+        return 0
+
+    except Exception as e:
+        print(f"❌ Authentication failed: {e}")
+        return 1
+
+
+def cmd_list_repos(args):
+    """Handle list-repos subcommand"""
+    try:
+        gh = GitHubWrapper()
+        if args.json:
+            repos = gh.list_repositories(args.owner, args.limit)
+            print(json.dumps(repos, indent=2))
+            return 0
+
+        # Only fetch the fields that are printed
+        repos = gh.list_repositories(
+            args.owner, args.limit, fields=("name", "url", "isPrivate")
+        )
+
+        print(f"Repositories for {args.owner}:")
+        for repo in repos:
+            privacy = "🔒" if repo.get("isPrivate", False) else "🌐"
+            print(f"  {privacy} {repo['name']} - {repo.get('url', 'N/A')}")
+
+        return 0
+
+    except Exception as e:
+        print(f"❌ Error listing repositories: {e}")
+        return 1
+
+
+def cmd_fork_repo(args):
+    """Handle fork-repo subcommand"""
+    try:
+        gh = GitHubWrapper()
+
+        repo_path = args.repository.replace("https://github.com/", "").rstrip("/")
+        if "/" not in repo_path:
+            repo_path = f"opendatahub-io/{repo_path}"
+        fork_url = f"https://github.com/{gh.get_fork_org()}/{repo_path.split('/')[-1]}"
+
+        # Fork the repository unless the fork is already there
+        if gh.fork_exists(repo_path):
+            print(f"ℹ️  Fork already exists: {fork_url}")
+        else:
+            print(f"🔄 Forking {args.repository}...")
+            gh.fork_repository(repo_path, clone_after_fork=False)
+            print(f"✅ Fork created: {fork_url}")
+
+        # Clone if requested
+        if args.clone:
+            print(f"🔄 Cloning fork...")
+            clone_result = gh.clone_repository(args.repository)
+
+            if clone_result["cloned"]:
+                print(f"✅ Repository cloned to: {clone_result['local_path']}")
+            else:
+                print(f"ℹ️  Repository already exists at: {clone_result['local_path']}")
+
+        return 0
+
+    except Exception as e:
+        print(f"❌ Error forking repository: {e}")
+        return 1
+
+
+def cmd_clone_repo(args):
+    """Handle clone-repo subcommand"""
+    try:
+        gh = GitHubWrapper()
+
+        print(f"🔄 Cloning {args.repository}...")
+        result = gh.clone_repository(args.repository)
+
+        if result["cloned"]:
+            print(f"✅ Repository cloned to: {result['local_path']}")
+        else:
+            print(f"ℹ️  Repository already exists at: {result['local_path']}")
+
+        return 0
+
+    except Exception as e:
+        print(f"❌ Error cloning repository: {e}")
+        return 1
+
+
+# Fork checkouts only need a working tree plus full commit history for
+# branching, rebasing and pushing; file contents for old commits are
+# fetched lazily by git if ever needed.
+PARTIAL_CLONE_FILTER = "blob:none"
+
+
+def _parallel_jobs(args=None) -> int:
+    """Number of repositories processed concurrently
+
+    --jobs takes precedence over the ODH_CLONE_JOBS environment variable.
+    """
+    jobs = getattr(args, "jobs", None)
+    if jobs is not None:
+        return jobs
+
+    env_jobs = os.environ.get("ODH_CLONE_JOBS", "8")
+    try:
+        return max(1, int(env_jobs))
+    except ValueError:
+        print(f"⚠️  Ignoring invalid ODH_CLONE_JOBS={env_jobs!r}, using 8")
+        return 8
+
+
+# Per-thread list that _run_parallel workers' github_wrapper log records are
+# held in until their item finishes (None outside a worker)
+_worker_logs = threading.local()
+
+
+class _WorkerLogFilter(logging.Filter):
+    """Divert github_wrapper records logged by a worker into its buffer"""
+
+    def filter(self, record):
+        buffer = getattr(_worker_logs, "records", None)
+        if buffer is None:
+            return True
+        buffer.append(record)
+        return False
+
+
+def _call_with_buffered_logs(func, item):
+    """Run func(*item) in a worker, returning (result, held log records)"""
+    records = []
+    _worker_logs.records = records
+    try:
+        return func(*item), records
+    finally:
+        _worker_logs.records = None
+
+
+def _run_parallel(func, work_items, max_workers: int) -> List[Dict[str, Any]]:
+    """
+    Run func(*item) for every work item on a bounded thread pool
+
+    Each call returns a result dict whose "output" entry holds the text it
+    would have printed. The github_wrapper log records a worker emits
+    (commands executed, failures) are held back as well. Both are written
+    as soon as that item finishes, so the printed output and log lines of
+    concurrently processed repositories never interleave.
+
+    With max_workers == 1 (e.g. ODH_CLONE_JOBS=1) items run inline in order,
+    which keeps tracebacks and debugger sessions simple.
+
+    Returns:
+        List of result dicts (without "output") in completion order
+    """
+    results = []
+    if not work_items:
+        return results
+
+    if max_workers <= 1 or len(work_items) == 1:
+        for item in work_items:
+            result = func(*item)
+            sys.stdout.write(result.pop("output", ""))
+            sys.stdout.flush()
+            results.append(result)
+        return results
+
+    logger = logging.getLogger("github_wrapper")
+    log_filter = _WorkerLogFilter()
+    logger.addFilter(log_filter)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            executor.submit(_call_with_buffered_logs, func, item)
+            for item in work_items
+        ]
+        for future in as_completed(futures):
+            result, records = future.result()
+            for record in records:
+                logger.handle(record)
+            sys.stdout.write(result.pop("output", ""))
+            sys.stdout.flush()
+            results.append(result)
+    except BaseException:
+        # On Ctrl-C (or an unexpected error) drop the queued items instead
+        # of running them all before the exception reaches the caller;
+        # items already started finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    finally:
+        logger.removeFilter(log_filter)
+    executor.shutdown()
+
+    return results
+
+
+def _tally_results(results):
+    """Count outcomes in one pass over the per-repository results
+
+    Results carry either a boolean "success" or a "status" of "success",
+    "no_changes" or "error".
+
+    Returns:
+        tuple: (successful count, no-change count, list of failed results)
+    """
+    successful = 0
+    no_changes = 0
+    failures = []
+    for r in results:
+        if r.get("success") or r.get("status") == "success":
+            successful += 1
+        elif r.get("status") == "no_changes":
+            no_changes += 1
+        else:
+            failures.append(r)
+    return successful, no_changes, failures
+
+
+def _existing_checkouts(src_dir):
+    """Return the names of the directories under src_dir from one scan"""
+    try:
+        with os.scandir(src_dir) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        return set()
+
+
+def _clone_additional_repo(gh, source_repo, branch, log=print, depth=None):
+    """Clone an additional repository straight from its source
+
+    Uses a blobless clone of the requested branch so no follow-up fetch or
+    checkout is needed. Falls back to a clone of the default branch without
+    the filter if that fails (e.g. the server rejects --filter or the branch
+    is missing). depth, if given, makes either clone shallow.
+
+    Returns:
+        Tuple of (clone_repository() result, whether the requested branch is
+        already checked out)
+    """
+    clone_url = f"https://github.com/{source_repo}"
+    try:
+        result = gh.clone_repository(
+            clone_url, depth=depth, filter_spec=PARTIAL_CLONE_FILTER, branch=branch
+        )
+    except subprocess.CalledProcessError as e:
+        reason = (e.stderr or "").strip().splitlines() or [str(e)]
+        log(f"    ⚠️  Partial clone failed, retrying with a full clone: {reason[-1]}")
+        return gh.clone_repository(clone_url, depth=depth), False
+
+    return result, bool(result["cloned"] and branch)
+
+
+def _checkout_requested_branch(gh, repo_path, branch, log=print):
+    """Check out an additional repository's requested branch, if any
+
+    Without a requested branch the current branch is kept. A branch that
+    cannot be checked out is reported and the current branch is kept.
+    """
+    if not branch:
+        log(f"  ✅ Using current branch: {gh.get_current_branch(repo_path)}")
+        return
+
+    log(f"  🔄 Setting up specific branch: {branch}")
+    try:
+        # Fetch from origin to get latest branches
+        gh._run_command(["git", "fetch", "origin"], cwd=repo_path, capture=False)
+
+        # Try to checkout the branch
+        gh._run_command(["git", "checkout", branch], cwd=repo_path, capture=False)
+        log(f"    ✅ Checked out branch: {branch}")
+    except Exception as branch_error:
+        log(f"    ⚠️  Could not checkout branch {branch}: {branch_error}")
+        log(f"    ℹ️  Staying on current branch: {gh.get_current_branch(repo_path)}")
+
+
+def _process_additional_repo(gh, repo_info, depth=None):
+    """Clone an additional repository from its source and check out its branch"""
+    out = io.StringIO()
+    log = functools.partial(print, file=out)
+
+    source_repo = repo_info['source_repo']
+    branch = repo_info['branch']
+
+    try:
+        log(f"\n📂 Processing {source_repo}...")
+        if branch:
+            log(f"    📋 Target branch: {branch}")
+
+        # Step 3a: Clone directly from source repository
+        # Additional repos are cloned directly from their source (no forking)
+        log(f"  🔄 Cloning directly from {source_repo}...")
+        result, on_branch = _clone_additional_repo(
+            gh, source_repo, branch, log=log, depth=depth
+        )
+
+        if result["cloned"]:
+            log(f"    ✅ Repository cloned to: {result['local_path']}")
+        else:
+            log(f"    ℹ️  Repository already exists at: {result['local_path']}")
+
+        # Step 3c: Setup repository for additional repos
+        log(f"  🔄 Setting up repository...")
+        repo_path = Path(result["local_path"])
+
+        # Step 3b: Handle branch setup for additional repos
+        if on_branch:
+            log(f"    ✅ Checked out branch: {branch}")
+        else:
+            _checkout_requested_branch(gh, repo_path, branch, log=log)
+
+        log(f"    ✅ Setup complete for {source_repo}")
+        result = {"repo": source_repo, "success": True}
+
+    except Exception as e:
+        log(f"    ❌ Error processing {source_repo}: {e}")
+        result = {"repo": source_repo, "success": False, "error": str(e)}
+
+    result["output"] = out.getvalue()
+    return result
+
+
+def _manifest_fork_states(gh, fork_org, repo_names, feature_branch):
+    """Look up manifest forks and their feature branch for clone-forks
+
+    Returns gh.batch_repo_state() results keyed by "fork_org/repo". If the
+    batched lookup is unavailable, the fork org is listed once instead so
+    gh.fork_exists() can answer from that list.
+    """
+    repo_states = gh.batch_repo_state(
+        [(fork_org, repo_name, feature_branch) for repo_name in repo_names]
+    )
+    if repo_names and not repo_states:
+        try:
+            gh.load_fork_list()
+        except Exception as e:
+            print(f"⚠️  Could not list repositories in {fork_org}: {e}")
+    return repo_states
+
+
+def _process_manifest_repo(
+    gh, fork_org, repo_name, base_branch, feature_branch, remote_state=None
+):
+    """Clone a manifest dependency fork, set up upstream and the feature branch
+
+    remote_state is this fork's entry from gh.batch_repo_state(), if available.
+    """
+    out = io.StringIO()
+    log = functools.partial(print, file=out)
+
+    fork_url = f"{fork_org}/{repo_name}"
+    original_repo = f"opendatahub-io/{repo_name}"
+
+    try:
+        log(f"\n📂 Processing {fork_url}...")
+
+        fork_missing = (
+            not remote_state["exists"]
+            if remote_state
+            else not gh.fork_exists(original_repo)
+        )
+        if fork_missing:
+            log(f"  🍴 Fork does not exist yet, forking {original_repo}...")
+            gh.fork_repository(original_repo, clone_after_fork=False)
+            if not gh.wait_for_fork_ready(repo_name):
+                raise RuntimeError(
+                    f"fork {fork_url} was not ready to clone in time"
+                )
+
+        # Step 3a: Clone fork
+        log(f"  🔄 Cloning fork...")
+        result = gh.clone_repository(fork_url, filter_spec=PARTIAL_CLONE_FILTER)
+
+        if result["cloned"]:
+            log(f"    ✅ Repository cloned to: {result['local_path']}")
+        else:
+            log(f"    ℹ️  Repository already exists at: {result['local_path']}")
+
+        # Step 3b: Setup upstream and rebase
+        log(f"  🔄 Setting up upstream and rebasing...")
+        repo_path = Path(result["local_path"])
+        upstream_url = f"https://github.com/{original_repo}"
+        gh.setup_upstream(repo_path, upstream_url)
+
+        # Step 3c: Create or checkout feature branch
+        log(f"  🔄 Setting up feature branch...")
+
+        if result["cloned"] and remote_state:
+            # A fresh clone's branches are exactly those on the fork
+            branch_present = remote_state["has_branch"]
+        else:
+            branch_present = gh.branch_exists(repo_path, feature_branch)
+
+        if not branch_present:
+            log(f"    🆕 Creating feature branch '{feature_branch}'...")
+            gh.create_branch(repo_path, feature_branch, base_branch)
+        else:
+            log(
+                f"    ✅ Feature branch '{feature_branch}' already exists, updating from origin..."
+            )
+            gh.update_feature_branch(repo_path, feature_branch)
+
+        log(f"    ✅ Setup complete for {fork_url}")
+        result = {"repo": fork_url, "success": True}
+
+    except Exception as e:
+        log(f"    ❌ Error processing {fork_url}: {e}")
+        result = {"repo": fork_url, "success": False, "error": str(e)}
+
+    result["output"] = out.getvalue()
+    return result
+
+
+def cmd_clone_forks(args):
+    """Handle clone-forks subcommand - clone all fork repositories"""
+    try:
+        gh = GitHubWrapper()
+
+        print("🔄 Cloning all fork repositories...")
+
+        # Get additional repositories from config first
+        additional_repos = gh.parse_additional_repositories()
+        print(
+            f"📋 Found {len(additional_repos)} additional repositories in configuration"
+        )
+
+        # Check if any additional repository provides opendatahub-operator
+        operator_from_additional = None
+        for repo_info in additional_repos:
+            if repo_info['repo_name'] == 'opendatahub-operator':
+                operator_from_additional = repo_info
+                print(f"✅ Found opendatahub-operator in additional repositories: {repo_info['source_repo']}")
+                if repo_info['branch']:
+                    print(f"    📋 Will use branch: {repo_info['branch']}")
+                else:
+                    print(f"    📋 Will use default branch")
+                break
+
+        # Handle --allow filtering
+        if args.allow:
+            print(f"🎯 Filtering enabled: Only processing repository '{args.allow}'")
+            if args.allow == 'opendatahub-operator':
+                print("    ℹ️  Will process opendatahub-operator and skip all other repositories")
+            else:
+                print("    ℹ️  Will still set up opendatahub-operator (required for manifest parsing)")
+                print(f"    ℹ️  Then process only: {args.allow}")
+
+        # Step 1: Ensure opendatahub-operator is available for dependency parsing
+        src_dir = gh.src_dir
+        operator_local_path = src_dir / "opendatahub-operator"
+        fork_org = gh.get_fork_org()
+        feature_branch = gh.get_branch_name()
+
+        if not operator_local_path.exists():
+            if operator_from_additional:
+                # Use additional repository for operator
+                source_repo = operator_from_additional['source_repo']
+                branch = operator_from_additional['branch']
+                operator_fork_url = f"{fork_org}/opendatahub-operator"
+                print(f"📋 Setting up opendatahub-operator from additional repository: {source_repo}")
+                if branch:
+                    print(f"    📋 Target branch: {branch}")
+            else:
+                # Use standard operator repository
+                operator_repo = "opendatahub-io/opendatahub-operator"
+                operator_fork_url = f"{fork_org}/opendatahub-operator"
+                print(f"📋 Setting up standard opendatahub-operator: {operator_repo}")
+
+            try:
+                if operator_from_additional:
+                    # Clone directly from source repository (no forking for additional repos)
+                    print(f"  🔄 Cloning directly from {source_repo}...")
+                    result, on_branch = _clone_additional_repo(
+                        gh, source_repo, branch, depth=args.depth
+                    )
+                else:
+                    # Standard operator - clone from fork
+                    print(f"  🔄 Cloning fork...")
+                    result = gh.clone_repository(
+                        operator_fork_url, filter_spec=PARTIAL_CLONE_FILTER
+                    )
+                if result["cloned"]:
+                    print(f"    ✅ Repository cloned to: {result['local_path']}")
+                else:
+                    print(
+                        f"    ℹ️  Repository already exists at: {result['local_path']}"
+                    )
+
+                # Setup operator repository 
+                repo_path = Path(result["local_path"])
+
+                if operator_from_additional:
+                    # Additional repo setup - already cloned from source, no upstream needed
+                    print(f"  🔄 Setting up operator from additional repository...")
+
+                    if on_branch:
+                        print(f"    ✅ Checked out branch: {branch}")
+                    else:
+                        _checkout_requested_branch(gh, repo_path, branch)
+
+                else:
+                    # Standard operator - full setup with upstream and feature branches
+                    print(f"  🔄 Setting up upstream and feature branch...")
+                    upstream_url = f"https://github.com/{operator_repo}"
+                    gh.setup_upstream(repo_path, upstream_url)
+
+                    base_branch = "main"
+
+                    if not gh.branch_exists(repo_path, feature_branch):
+                        print(f"    🆕 Creating feature branch '{feature_branch}' from '{base_branch}'...")
+                        gh.create_branch(repo_path, feature_branch, base_branch)
+                    else:
+                        print(
+                            f"    ✅ Feature branch '{feature_branch}' already exists, updating from origin..."
+                        )
+                        gh.update_feature_branch(repo_path, feature_branch)
+
+                print(f"    ✅ Operator setup complete!")
+
+            except Exception as e:
+                print(f"❌ Error setting up operator repository: {e}")
+                print("🔍 This repository is required to parse manifest dependencies")
+                return 1
+        else:
+            print(f"✅ Operator repository already available at: {operator_local_path}")
+            # Update existing repository based on whether it's from additional repos or standard
+            try:
+                if operator_from_additional:
+                    # For additional repo - handle upstream if specific branch requested
+                    if operator_from_additional['branch']:
+                        # Specific branch requested - set up upstream and fetch
+                        target_branch = operator_from_additional['branch']
+                        source_repo = operator_from_additional['source_repo']
+                        print(f"    🔄 Setting up upstream for target branch: {target_branch}")
+
+                        # Set up upstream to source repository
+                        upstream_url = f"https://github.com/{source_repo}"
+                        try:
+                            gh.setup_upstream(operator_local_path, upstream_url)
+
+                            current_branch = gh.get_current_branch(operator_local_path)
+
+                            if current_branch != target_branch:
+                                try:
+                                    # setup_upstream() has just fetched upstream
+                                    gh._run_command(["git", "checkout", target_branch], cwd=operator_local_path, capture=False)
+                                    print(f"    ✅ Switched to branch: {target_branch}")
+                                except Exception as branch_error:
+                                    print(f"    ⚠️  Could not switch to branch {target_branch}: {branch_error}")
+                            else:
+                                print(f"    ✅ Already on target branch: {target_branch}")
+                                # Pull latest changes from upstream
+                                try:
+                                    gh._run_command(["git", "pull", "upstream", target_branch], cwd=operator_local_path, capture=False)
+                                    print(f"    ✅ Updated from upstream/{target_branch}")
+                                except Exception as pull_error:
+                                    print(f"    ⚠️  Could not pull from upstream: {pull_error}")
+
+                        except Exception as upstream_error:
+                            print(f"    ⚠️  Could not set up upstream: {upstream_error}")
+                    else:
+                        # No specific branch - just report current branch (no upstream needed)
+                        current_branch = gh.get_current_branch(operator_local_path)
+                        print(f"    ✅ Using current branch: {current_branch} (no upstream setup)")
+
+                else:
+                    # For standard repo, use feature branch workflow
+                    if gh.branch_exists(operator_local_path, feature_branch):
+                        print(
+                            f"    🔄 Updating feature branch '{feature_branch}' from origin..."
+                        )
+                        gh.update_feature_branch(operator_local_path, feature_branch)
+                    else:
+                        print(f"    ℹ️  Feature branch '{feature_branch}' does not exist, staying on current branch")
+                        
+            except Exception as e:
+                print(f"    ⚠️  Could not update operator repository: {e}")
+
+        # Step 2: Parse manifest repositories from get_all_manifests.sh
+        try:
+            print("📋 Parsing manifest dependencies...")
+            manifest_repos = gh.parse_manifest_repositories()
+            print(
+                f"📋 Found {len(manifest_repos)} repositories in manifest dependencies"
+            )
+        except Exception as e:
+            print(f"❌ Error parsing manifest repositories: {e}")
+            return 1
+
+        # One directory scan answers every "local checkout exists" check
+        existing = _existing_checkouts(src_dir)
+
+        if args.dry_run:
+            print("\n🔍 DRY RUN - Would clone the following repositories:")
+            if args.allow:
+                print(f"    🎯 Filtering: Only showing '{args.allow}'")
+
+            # Apply same filtering logic as in actual processing
+            if args.allow and args.allow != 'opendatahub-operator':
+                filtered_manifest_repos = {name: branch for name, branch in manifest_repos.items() if name == args.allow}
+                filtered_additional_repos = [repo for repo in additional_repos if repo['repo_name'] == args.allow]
+            elif args.allow == 'opendatahub-operator':
+                filtered_manifest_repos = {}
+                filtered_additional_repos = []
+            else:
+                filtered_manifest_repos = manifest_repos
+                filtered_additional_repos = additional_repos
+
+            print("  📦 Manifest Dependencies:")
+            if filtered_manifest_repos:
+                # Missing forks are created from opendatahub-io before cloning
+                fork_names = [
+                    name for name in filtered_manifest_repos
+                    if name != "opendatahub-operator"
+                ]
+                repo_states = _manifest_fork_states(
+                    gh, fork_org, fork_names, feature_branch
+                )
+                for repo_name, base_branch in filtered_manifest_repos.items():
+                    fork_url = f"{fork_org}/{repo_name}"
+                    status = "exists" if repo_name in existing else "would clone"
+                    if repo_name in fork_names:
+                        state = repo_states.get(fork_url)
+                        fork_missing = (
+                            not state["exists"]
+                            if state
+                            else not gh.fork_exists(f"opendatahub-io/{repo_name}")
+                        )
+                        if fork_missing:
+                            status = f"would fork opendatahub-io/{repo_name}, {status}"
+                    print(f"    • {fork_url} (base: {base_branch}) - {status}")
+            else:
+                print("    (no manifest dependencies to process)")
+
+            print("\n  ➕ Additional Repositories:")
+            if filtered_additional_repos:
+                for repo_info in filtered_additional_repos:
+                    source_repo = repo_info['source_repo']
+                    branch = repo_info['branch']
+                    repo_name = repo_info['repo_name']
+                    status = "exists" if repo_name in existing else "would clone"
+                    branch_info = f"branch: {branch}" if branch else "base: auto-detect"
+                    print(f"    • {source_repo} ({branch_info}) - {status}")
+            else:
+                print("    (no additional repositories to process)")
+
+            return 0
+
+        # Step 3: Clone all repositories and set them up
+        jobs = _parallel_jobs(args)
+        results = []
+        processed = 0
+        skipped = 0
+
+        # Process manifest repositories
+        if args.allow and args.allow != 'opendatahub-operator':
+            # Filter manifest repos to only the allowed one
+            filtered_manifest_repos = {name: branch for name, branch in manifest_repos.items() if name == args.allow}
+            if filtered_manifest_repos:
+                print(f"\n📦 Processing manifest dependencies (filtered to 1 repository: {args.allow}):")
+            else:
+                print(f"\n📦 No manifest dependencies match '{args.allow}' - skipping manifest processing")
+                filtered_manifest_repos = {}
+        elif args.allow == 'opendatahub-operator':
+            # Skip all manifest repos if only processing operator
+            print(f"\n📦 Skipping manifest dependencies (only processing opendatahub-operator)")
+            filtered_manifest_repos = {}
+        else:
+            # Process all manifest repos
+            print(f"\n📦 Processing manifest dependencies ({len(manifest_repos)} repositories):")
+            filtered_manifest_repos = manifest_repos
+            
+        # Skip opendatahub-operator since we already handled it in Step 1
+        if "opendatahub-operator" in filtered_manifest_repos:
+            print(f"⏭️  Skipping opendatahub-operator (already processed in Step 1)")
+            skipped += 1
+            filtered_manifest_repos = {
+                name: branch
+                for name, branch in filtered_manifest_repos.items()
+                if name != "opendatahub-operator"
+            }
+
+        manifest_jobs = []
+        for repo_name, base_branch in filtered_manifest_repos.items():
+            fork_url = f"{fork_org}/{repo_name}"
+
+            # Skip if local checkout exists and --skip-existing is set
+            if args.skip_existing and repo_name in existing:
+                print(f"⏭️  Skipping {fork_url} (local checkout exists)")
+                skipped += 1
+                continue
+
+            manifest_jobs.append((gh, fork_org, repo_name, base_branch, feature_branch))
+
+        # Look up all forks and their feature branches in one API request
+        repo_states = _manifest_fork_states(
+            gh, fork_org, [job[2] for job in manifest_jobs], feature_branch
+        )
+        manifest_jobs = [
+            job + (repo_states.get(f"{fork_org}/{job[2]}"),) for job in manifest_jobs
+        ]
+
+        processed += len(manifest_jobs)
+        results.extend(_run_parallel(_process_manifest_repo, manifest_jobs, jobs))
+
+        # Process additional repositories (excluding any already processed as operator)
+        if additional_repos:
+            # Repositories already set up in Step 1
+            handled = (
+                frozenset({"opendatahub-operator"})
+                if operator_from_additional
+                else frozenset()
+            )
+            remaining_additional_repos = [
+                repo for repo in additional_repos
+                if repo['repo_name'] not in handled
+            ]
+            
+            # Apply --allow filtering to additional repos
+            if args.allow and args.allow != 'opendatahub-operator':
+                # Filter to only the allowed repo
+                remaining_additional_repos = [
+                    repo for repo in remaining_additional_repos
+                    if repo['repo_name'] == args.allow
+                ]
+                if remaining_additional_repos:
+                    print(f"\n➕ Processing additional repositories (filtered to 1 repository: {args.allow}):")
+                else:
+                    print(f"\n➕ No additional repositories match '{args.allow}' - skipping additional processing")
+            elif args.allow == 'opendatahub-operator':
+                # Skip all additional repos if only processing operator
+                print(f"\n➕ Skipping additional repositories (only processing opendatahub-operator)")
+                remaining_additional_repos = []
+            else:
+                # Show message if operator was skipped
+                if operator_from_additional and len(remaining_additional_repos) < len(additional_repos):
+                    print(f"\n⏭️  Skipping opendatahub-operator from additional repositories (already processed as operator)")
+                
+                if remaining_additional_repos:
+                    print(
+                        f"\n➕ Processing remaining additional repositories ({len(remaining_additional_repos)} repositories):"
+                    )
+            
+            # Process the remaining additional repositories (outside the filtering logic)
+            if remaining_additional_repos:
+                additional_jobs = []
+                # Rescan: the manifest step may have added checkouts
+                existing = _existing_checkouts(src_dir) if args.skip_existing else set()
+                for repo_info in remaining_additional_repos:
+                    # Skip if local checkout exists and --skip-existing is set
+                    if args.skip_existing and repo_info['repo_name'] in existing:
+                        print(f"⏭️  Skipping {repo_info['source_repo']} (local checkout exists)")
+                        skipped += 1
+                        continue
+
+                    additional_jobs.append((gh, repo_info, args.depth))
+
+                processed += len(additional_jobs)
+                results.extend(
+                    _run_parallel(_process_additional_repo, additional_jobs, jobs)
+                )
+            else:
+                if operator_from_additional:
+                    print(f"\n✅ No additional repositories to process (opendatahub-operator already handled)")
+                else:
+                    print(f"\n✅ No additional repositories to process")
+
+        # Summary
+        successful, _, failures = _tally_results(results)
+        failed = len(failures)
+
+        print(f"\n📊 Summary:")
+        print(f"  📂 Processed: {processed}")
+        print(f"  ⏭️  Skipped: {skipped}")
+        print(f"  ✅ Successful: {successful}")
+        print(f"  ❌ Failed: {failed}")
+
+        if failed > 0:
+            print("\n❌ Failed repositories:")
+            for r in failures:
+                print(f"  • {r['repo']}: {r.get('error', 'Unknown error')}")
+
+        return 0 if failed == 0 else 1
+
+    except Exception as e:
+        print(f"❌ Error in clone-forks operation: {e}")
+        return 1
+
+
+def cmd_show_config(args):
+    """Handle show-config subcommand"""
+    try:
+        gh = GitHubWrapper()
+        config = gh.config
+
+        # Collect the report and write it in one go
+        out = io.StringIO()
+        log = functools.partial(print, file=out)
+
+        log("📋 Current Configuration:")
+        log(f"  Project Root: {gh.project_root}")
+        log(f"  Config File: {gh.config_file}")
+        log(f"  Token File: {gh.token_file}")
+        log()
+
+        log("🔗 GitHub Settings:")
+        github_config = config.get("github", {})
+        log(f"  Fork Organization: {github_config.get('fork_org', 'N/A')}")
+        log(f"  Branch Name: {github_config.get('branch_name', 'N/A')}")
+        log(f"  Base Branch: {github_config.get('base_branch', 'N/A')}")
+        log()
+
+        log("📦 Repository Sources:")
+        log("  Manifest Dependencies: Parsed from get_all_manifests.sh")
+        additional_repos = config.get("additional_repositories", [])
+        if additional_repos:
+            log("  ➕ Additional Repositories:")
+            for repo in additional_repos:
+                if ':' in repo:
+                    source_repo, branch = repo.split(':', 1)
+                    repo_name = source_repo.split('/')[-1]
+                    log(
+                        f"    • {source_repo} → {github_config.get('fork_org', 'N/A')}/{repo_name} (branch: {branch})"
+                    )
+                else:
+                    repo_name = repo.split('/')[-1]
+                    log(
+                        f"    • {repo} → {github_config.get('fork_org', 'N/A')}/{repo_name}"
+                    )
+        else:
+            log("  ➕ Additional Repositories: None configured")
+        log()
+
+        log("🐳 Registry Settings:")
+        registry_config = config.get("registry", {})
+        log(f"  URL: {registry_config.get('url', 'N/A')}")
+        log(f"  Namespace: {registry_config.get('namespace', 'N/A')}")
+        log(f"  Tag: {registry_config.get('tag', 'N/A')}")
+        log()
+
+        log("🏗️ Build Settings:")
+        build_config = config.get("build", {})
+        log(f"  Local Mode: {build_config.get('local', 'N/A')}")
+        log(f"  Use Branch: {build_config.get('use_branch', 'N/A')}")
+        log(f"  Build Image: {build_config.get('image', 'N/A')}")
+        log(f"  Custom Registry: {build_config.get('custom_registry', 'N/A')}")
+        log(f"  Manifests Only: {build_config.get('manifests_only', 'N/A')}")
+        log()
+
+        log("🔄 Migration Settings:")
+        migration_config = config.get("migration", {})
+        log(f"  Target API: {migration_config.get('target_api', 'N/A')}")
+        log(f"  Source Path: {migration_config.get('source_path', 'N/A')}")
+        log(f"  Pattern: {migration_config.get('pattern', 'N/A')}")
+
+        sys.stdout.write(out.getvalue())
+
+        return 0
+
+    except Exception as e:
+        print(f"❌ Error loading configuration: {e}")
+        return 1
+
+
+def cmd_fork_all(args):
+    """Handle fork-all subcommand - forks additional repositories from configuration"""
+    try:
+        gh = GitHubWrapper()
+
+        print("🔄 Forking additional repositories...")
+        additional_repos = gh.parse_additional_repositories()
+
+        if not additional_repos:
+            print("ℹ️  No additional repositories configured in config.yaml")
+            print(
+                "💡 Note: Manifest dependencies are handled automatically by clone-forks"
+            )
+            return 0
+
+        results = []
+        fork_org = gh.get_fork_org()
+
+        print(f"\n📂 Processing {len(additional_repos)} additional repositories:")
+
+        # One listing of the fork org answers every fork_exists() check
+        try:
+            gh.load_fork_list()
+        except Exception as e:
+            print(f"⚠️  Could not list repositories in {fork_org}: {e}")
+
+        for repo_info in additional_repos:
+            source_repo = repo_info['source_repo']
+            branch = repo_info['branch']
+            repo_name = repo_info['repo_name']
+
+            try:
+                if gh.fork_exists(source_repo):
+                    fork_result = RepoInfo(
+                        owner=source_repo.split('/')[0],
+                        name=repo_name,
+                        url=f"https://github.com/{source_repo}",
+                        fork_owner=fork_org,
+                    )
+                else:
+                    print(f"  🔄 Forking {source_repo}...")
+                    if branch:
+                        print(f"    📋 Target branch: {branch}")
+                    fork_result = gh.fork_repository(source_repo)
+
+                # Since fork_repository returns RepoInfo, just show that fork is available
+                print(
+                    f"    ✅ Fork available: {fork_result.fork_owner}/{fork_result.name}"
+                )
+
+                # Clone if requested
+                if args.clone:
+                    print(f"  🔄 Cloning fork...")
+                    clone_result = gh.clone_repository(
+                        f"{fork_result.fork_owner}/{fork_result.name}"
+                    )
+
+                    if clone_result["cloned"]:
+                        print(
+                            f"    ✅ Repository cloned to: {clone_result['local_path']}"
+                        )
+                    else:
+                        print(
+                            f"    ℹ️  Repository already exists at: {clone_result['local_path']}"
+                        )
+
+                    # If a specific branch was specified, checkout that branch
+                    if branch:
+                        print(f"  🔄 Setting up specific branch: {branch}")
+                        repo_path = Path(clone_result['local_path'])
+                        
+                        # Set up upstream remote to the source repository
+                        upstream_url = f"https://github.com/{source_repo}"
+                        gh.setup_upstream(repo_path, upstream_url)
+                        
+                        # Check if the branch exists locally or remotely
+                        try:
+                            # Try to checkout the branch if it exists locally
+                            gh._run_command(["git", "checkout", branch], cwd=repo_path, capture=False)
+                            print(f"    ✅ Checked out existing local branch: {branch}")
+                        except Exception:
+                            try:
+                                # Try to checkout from upstream
+                                gh._run_command(["git", "fetch", "upstream"], cwd=repo_path, capture=False)
+                                gh._run_command(
+                                    ["git", "checkout", "-b", branch, f"upstream/{branch}"], 
+                                    cwd=repo_path,
+                                    capture=False,
+                                )
+                                print(f"    ✅ Created and checked out branch from upstream: {branch}")
+                            except Exception as branch_error:
+                                print(f"    ⚠️  Could not checkout branch {branch}: {branch_error}")
+                                print(f"    ℹ️  Repository remains on default branch")
+
+                results.append({"repo": source_repo, "success": True})
+
+            except Exception as e:
+                print(f"    ❌ Error processing {source_repo}: {e}")
+                results.append({"repo": source_repo, "success": False, "error": str(e)})
+
+        # Summary
+        successful, _, failures = _tally_results(results)
+        failed = len(failures)
+
+        print(f"\n📊 Summary:")
+        print(f"  ✅ Successful: {successful}")
+        print(f"  ❌ Failed: {failed}")
+
+        if failed > 0:
+            print("\n❌ Failed repositories:")
+            for r in failures:
+                print(f"  • {r['repo']}: {r.get('error', 'Unknown error')}")
+
+        print(
+            "\n💡 Tip: Use 'clone-forks' for complete setup with manifest dependencies"
+        )
+
+        return 0 if failed == 0 else 1
+
+    except Exception as e:
+        print(f"❌ Error in fork-all operation: {e}")
+        return 1
+
+
+def cmd_setup_operator(args):
+    """Handle setup-operator subcommand"""
+    try:
+        gh = GitHubWrapper()
+
+        operator_repo = "opendatahub-io/opendatahub-operator"
+
+        print("🔄 Setting up OpenDataHub operator...")
+
+        # Check if local checkout already exists
+        repo_name = operator_repo.split("/")[-1]
+        local_path = gh.project_root / "src" / repo_name
+
+        if local_path.exists() and not args.force:
+            print(f"ℹ️  Local checkout already exists at: {local_path}")
+            print("   Use --force to recreate or proceed with existing checkout")
+            return 0
+
+        # Step 1: Fork repository
+        print("📋 Step 1: Forking repository...")
+        fork_result = gh.fork_repository(operator_repo)
+
+        if fork_result["created"]:
+            print(f"✅ Fork created: {fork_result['fork_url']}")
+        else:
+            print(f"ℹ️  Fork already exists: {fork_result['fork_url']}")
+
+        # Step 2: Clone fork
+        print("📋 Step 2: Cloning fork...")
+        clone_result = gh.clone_repository(operator_repo)
+
+        if clone_result["cloned"]:
+            print(f"✅ Repository cloned to: {clone_result['local_path']}")
+        else:
+            print(f"ℹ️  Repository already exists at: {clone_result['local_path']}")
+
+        # Step 3: Setup upstream and rebase
+        print("📋 Step 3: Setting up upstream and rebasing...")
+        gh.setup_upstream(operator_repo)
+
+        # Step 4: Create feature branch
+        print("📋 Step 4: Creating feature branch...")
+        feature_branch = gh.get_branch_name()
+        gh.create_branch(operator_repo, feature_branch)
+
+        print(f"✅ OpenDataHub operator setup complete!")
+        print(f"   📁 Location: {clone_result['local_path']}")
+        print(f"   🌿 Branch: {feature_branch}")
+        print(f"   🔗 Fork: {fork_result['fork_url']}")
+
+        return 0
+
+    except Exception as e:
+        print(f"❌ Error setting up operator: {e}")
+        return 1
+
+
+def _setup_manifest_repo(gh, fork_org, repo_name, base_branch):
+    """Fork, clone and branch one manifest repository"""
+    out = io.StringIO()
+    log = functools.partial(print, file=out)
+    fork_url = f"{fork_org}/{repo_name}"
+
+    log(f"\n📂 Processing opendatahub-io/{repo_name} (base: {base_branch})...")
+    try:
+        gh.setup_manifest_repository(repo_name, base_branch, raise_errors=True)
+        log(f"    ✅ Setup complete for {fork_url}")
+        result = {"repo": fork_url, "success": True}
+    except Exception as e:
+        log(f"    ❌ Error processing {fork_url}: {e}")
+        result = {"repo": fork_url, "success": False, "error": str(e)}
+
+    result["output"] = out.getvalue()
+    return result
+
+
+def cmd_setup_manifests(args):
+    """Handle setup-manifests subcommand (also used for setup-forks)"""
+    try:
+        gh = GitHubWrapper()
+
+        print("🔄 Setting up manifest repository forks...")
+
+        # Parse manifest repositories from get_all_manifests.sh
+        manifest_repos = gh.parse_manifest_repositories()
+
+        print(f"📋 Found {len(manifest_repos)} repositories in manifest dependencies")
+
+        if args.dry_run:
+            print("\n🔍 DRY RUN - Would process the following repositories:")
+            for repo_name, base_branch in manifest_repos.items():
+                print(f"  • opendatahub-io/{repo_name} (base: {base_branch})")
+            return 0
+
+        skipped = 0
+        fork_org = gh.get_fork_org()
+        src_dir = gh.src_dir
+
+        existing = _existing_checkouts(src_dir) if args.skip_existing else set()
+
+        work_items = []
+        for repo_name, base_branch in manifest_repos.items():
+            # Skip if local checkout exists and --skip-existing is set
+            if args.skip_existing and repo_name in existing:
+                print(f"⏭️  Skipping opendatahub-io/{repo_name} (local checkout exists)")
+                skipped += 1
+                continue
+
+            work_items.append((gh, fork_org, repo_name, base_branch))
+
+        # One listing of the fork org answers every fork_exists() check
+        if work_items:
+            try:
+                gh.load_fork_list()
+            except Exception as e:
+                print(f"⚠️  Could not list repositories in {fork_org}: {e}")
+
+        processed = len(work_items)
+        results = _run_parallel(_setup_manifest_repo, work_items, _parallel_jobs(args))
+
+        # Summary
+        successful, _, failures = _tally_results(results)
+        failed = len(failures)
+
+        print(f"\n📊 Summary:")
+        print(f"  📂 Processed: {processed}")
+        print(f"  ⏭️  Skipped: {skipped}")
+        print(f"  ✅ Successful: {successful}")
+        print(f"  ❌ Failed: {failed}")
+
+        if failed > 0:
+            print("\n❌ Failed repositories:")
+            for r in failures:
+                print(f"  • {r['repo']}: {r.get('error', 'Unknown error')}")
+
+        return 0 if failed == 0 else 1
+
+    except Exception as e:
+        print(f"❌ Error in setup-manifests operation: {e}")
+        return 1
+
+
+def _list_git_repos(src_dir):
+    """Return the git checkouts directly under src_dir, sorted by name"""
+    with os.scandir(src_dir) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, ".git"))
+        )
+
+
+def _parse_status_v2(output):
+    """Parse `git status --porcelain=v2 --branch` output
+
+    Returns:
+        Tuple of (current branch or "" when detached, list of (XY, path)
+        entries using the short-format status codes)
+    """
+    branch = ""
+    entries = []
+    for line in output.splitlines():
+        if line.startswith("# branch.head "):
+            head = line[len("# branch.head "):]
+            branch = "" if head == "(detached)" else head
+        elif line.startswith("1 ") or line.startswith("u "):
+            fields = line.split(" ", 10 if line[0] == "u" else 8)
+            entries.append((fields[1].replace(".", " "), fields[-1]))
+        elif line.startswith("2 "):
+            fields = line.split(" ", 9)
+            path, _, orig_path = fields[-1].partition("\t")
+            entries.append((fields[1].replace(".", " "), f"{orig_path} -> {path}"))
+        elif line.startswith("? "):
+            entries.append(("??", line[2:]))
+    return branch, entries
+
+
+def _repo_status(repo_dir):
+    """Collect branch, working tree and remote information for one checkout"""
+    repo_name = repo_dir.name
+    try:
+        # Branch and working tree state in one call. Ahead/behind counts
+        # are never displayed, and a read-only report should not rewrite
+        # the index.
+        result = subprocess.run(
+            [
+                "git",
+                "--no-optional-locks",
+                "status",
+                "--porcelain=v2",
+                "--branch",
+                "--no-ahead-behind",
+            ],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        current_branch, entries = _parse_status_v2(result.stdout)
+        status_lines = [f"{xy} {path}" for xy, path in entries]
+
+        # Count changes by type in one pass: unstaged modifications and
+        # deletions, newly added files and untracked files (porcelain v2
+        # ".M"/".D" arrive here as " M"/" D"); each entry counts at most once
+        counts = Counter()
+        for xy, _ in entries:
+            if xy == " M":
+                counts["modified"] += 1
+            elif xy[0] == "A":
+                counts["added"] += 1
+            elif xy == " D":
+                counts["deleted"] += 1
+            elif xy == "??":
+                counts["untracked"] += 1
+
+        is_dirty = len(entries) > 0
+
+        remotes = read_remote_urls(repo_dir)
+
+        origin_url = remotes.get("origin", "N/A")
+        upstream_url = remotes.get("upstream", "N/A")
+
+        # Get fork org from origin URL
+        fork_org = "N/A"
+        if "github.com" in origin_url:
+            try:
+                if origin_url.startswith("git@"):
+                    # SSH format: git@github.com:org/repo.git
+                    fork_org = origin_url.split(":")[1].split("/")[0]
+                else:
+                    # HTTPS format: https://github.com/org/repo.git
+                    fork_org = origin_url.split("/")[-2]
+            except:
+                pass
+
+        return {
+            "name": repo_name,
+            "branch": current_branch,
+            "is_dirty": is_dirty,
+            "modified": counts["modified"],
+            "added": counts["added"],
+            "deleted": counts["deleted"],
+            "untracked": counts["untracked"],
+            "origin_url": origin_url,
+            "upstream_url": upstream_url,
+            "fork_org": fork_org,
+            "status_lines": status_lines,
+        }
+
+    except Exception as e:
+        return {"name": repo_name, "error": str(e)}
+
+
+def _collect_repo_statuses(repos):
+    """Return _repo_status() for every checkout, in the order given
+
+    Repositories are independent, so they are queried concurrently.
+    """
+    if not repos:
+        return []
+    with ThreadPoolExecutor(max_workers=min(32, len(repos))) as executor:
+        return list(executor.map(_repo_status, repos))
+
+
+def _print_forks_status_json(repos, args):
+    """Print forks-status results as one JSON document"""
+    statuses = _collect_repo_statuses(repos)
+
+    errors = [s for s in statuses if "error" in s]
+    checked = [s for s in statuses if "error" not in s]
+    dirty_count = sum(1 for s in checked if s["is_dirty"])
+    shown = [s for s in checked if s["is_dirty"]] if args.dirty else checked
+
+    if not args.show_files:
+        shown = [
+            {k: v for k, v in s.items() if k != "status_lines"} for s in shown
+        ]
+
+    print(
+        json.dumps(
+            {
+                "repositories": shown,
+                "errors": errors,
+                "summary": {
+                    "total": len(checked),
+                    "clean": len(checked) - dirty_count,
+                    "dirty": dirty_count,
+                },
+            },
+            indent=2,
+        )
+    )
+    return 0 if not errors else 1
+
+
+def cmd_forks_status(args):
+    """Handle forks-status subcommand"""
+    try:
+        gh = GitHubWrapper()
+
+        # Set up logging level
+        if not args.verbose:
+            logging.getLogger().setLevel(logging.WARNING)
+
+        # Get all repositories from src directory
+        src_dir = gh.project_root / "src"
+        repos = _list_git_repos(src_dir) if src_dir.exists() else []
+
+        if args.json:
+            return _print_forks_status_json(repos, args)
+
+        print("📋 Repository Status Summary:")
+        print()
+
+        if not src_dir.exists():
+            print("ℹ️  No src directory found - no repositories to check")
+            return 0
+
+        if not repos:
+            print("ℹ️  No git repositories found in src directory")
+            return 0
+
+        clean_repos = []
+        dirty_repos = []
+
+        for repo_info in _collect_repo_statuses(repos):
+            if "error" in repo_info:
+                print(f"❌ Error checking {repo_info['name']}: {repo_info['error']}")
+            elif repo_info["is_dirty"]:
+                dirty_repos.append(repo_info)
+            else:
+                clean_repos.append(repo_info)
+
+        # Filter display based on --dirty flag
+        repos_to_show = dirty_repos if args.dirty else (clean_repos + dirty_repos)
+
+        if not repos_to_show:
+            if args.dirty:
+                print("✅ No repositories with uncommitted changes")
+            else:
+                print("ℹ️  No repositories found")
+            return 0
+
+        # Display repository status, written out in one go at the end
+        out = io.StringIO()
+        log = functools.partial(print, file=out)
+
+        for repo_info in repos_to_show:
+            status_icon = "🔄" if repo_info["is_dirty"] else "✅"
+            changes = []
+
+            if repo_info["modified"] > 0:
+                changes.append(f"{repo_info['modified']}M")
+            if repo_info["added"] > 0:
+                changes.append(f"{repo_info['added']}A")
+            if repo_info["deleted"] > 0:
+                changes.append(f"{repo_info['deleted']}D")
+            if repo_info["untracked"] > 0:
+                changes.append(f"{repo_info['untracked']}U")
+
+            change_summary = f" ({', '.join(changes)})" if changes else ""
+
+            log(
+                f"{status_icon} {repo_info['fork_org']}/{repo_info['name']}:{repo_info['branch']}{change_summary}"
+            )
+
+            # Show detailed file changes if requested
+            if args.show_files and repo_info["is_dirty"]:
+                for line in repo_info["status_lines"]:
+                    if line.strip():
+                        log(f"    {line}")
+
+            # Show remote URLs
+            log(f"    🔗 origin: {repo_info['origin_url']}")
+            log(f"    🔗 upstream: {repo_info['upstream_url']}")
+            log()
+
+        # Summary
+        total = len(clean_repos) + len(dirty_repos)
+        clean_count = len(clean_repos)
+        dirty_count = len(dirty_repos)
+
+        if not args.dirty:
+            log(
+                f"📊 Summary: {total} repositories ({clean_count} clean, {dirty_count} dirty)"
+            )
+        else:
+            log(f"📊 Summary: {dirty_count} repositories with changes")
+
+        sys.stdout.write(out.getvalue())
+
+        return 0
+
+    except Exception as e:
+        print(f"❌ Error checking repository status: {e}")
+        return 1
+
+
+def _commit_and_push_repo(repo_dir, commit_message, branch_name):
+    """Commit all changes in one checkout and push them to origin"""
+    out = io.StringIO()
+    log = functools.partial(print, file=out)
+    repo_name = repo_dir.name
+
+    try:
+        log(f"📂 Processing {repo_name}...")
+
+        # Check if there are changes to commit (only emptiness matters, so
+        # the output is not decoded)
+        result = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=repo_dir,
+            capture_output=True,
+            check=True,
+        )
+
+        if not result.stdout.strip():
+            log(f"    ℹ️  No changes to commit")
+            result = {"repo": repo_name, "status": "no_changes"}
+        else:
+            # Add all changes
+            log(f"    📋 Adding changes...")
+            subprocess.run(
+                ["git", "add", "."],
+                cwd=repo_dir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True,
+            )
+
+            # Commit changes
+            log(f"    💾 Committing changes...")
+            result = subprocess.run(
+                ["git", "commit", "-m", commit_message],
+                cwd=repo_dir,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            log(result.stdout.rstrip())
+
+            # Push changes
+            log(f"    🚀 Pushing changes to origin {branch_name}...")
+            subprocess.run(
+                ["git", "push", "origin", branch_name],
+                cwd=repo_dir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True,
+            )
+
+            log(f"    ✅ Successfully committed and pushed changes")
+            result = {"repo": repo_name, "status": "success"}
+
+    except subprocess.CalledProcessError as e:
+        log(f"    ❌ Error committing {repo_name}: {e}")
+        if e.stderr:
+            log(e.stderr.rstrip())
+        result = {"repo": repo_name, "status": "error", "error": str(e)}
+    except Exception as e:
+        log(f"    ❌ Unexpected error with {repo_name}: {e}")
+        result = {"repo": repo_name, "status": "error", "error": str(e)}
+
+    result["output"] = out.getvalue()
+    return result
+
+
+def cmd_forks_commit(args):
+    """Handle forks-commit subcommand"""
+    try:
+        gh = GitHubWrapper()
+
+        commit_message = args.message or "Gateway API migration changes"
+
+        print("🔄 Committing changes across all repositories...")
+        print(f"📝 Commit message: {commit_message}")
+        print()
+
+        # Get all repositories from src directory
+        src_dir = gh.project_root / "src"
+        if not src_dir.exists():
+            print("ℹ️  No src directory found - no repositories to commit")
+            return 0
+
+        repos = _list_git_repos(src_dir)
+
+        if not repos:
+            print("ℹ️  No git repositories found in src directory")
+            return 0
+
+        branch_name = gh.get_branch_name()
+
+        work_items = [(repo_dir, commit_message, branch_name) for repo_dir in repos]
+        results = sorted(
+            _run_parallel(_commit_and_push_repo, work_items, _parallel_jobs(args)),
+            key=lambda r: r["repo"],
+        )
+
+        # Summary
+        successful, no_changes, failures = _tally_results(results)
+        failed = len(failures)
+
+        print(f"\n📊 Summary:")
+        print(f"  ✅ Successful: {successful}")
+        print(f"  ℹ️  No changes: {no_changes}")
+        print(f"  ❌ Failed: {failed}")
+
+        if failed > 0:
+            print("\n❌ Failed repositories:")
+            for r in failures:
+                print(f"  • {r['repo']}: {r.get('error', 'Unknown error')}")
+
+        return 0 if failed == 0 else 1
+
+    except Exception as e:
+        print(f"❌ Error in forks-commit operation: {e}")
+        return 1
+
+
+def _task_description(task_path):
+    """Return the description comment from the first lines of a task file"""
+    with open(task_path, "r") as f:
+        # Only the first few lines can hold the description
+        for line in itertools.islice(f, 5):
+            line = line.strip()
+            if line.startswith("#") and any(
+                word in line.lower() for word in ["ansible", "task", "file"]
+            ):
+                return line[1:].strip()
+    return "Ansible task file"
+
+
+# --var KEY=VALUE; KEY must be a valid Ansible variable name
+_VAR_ASSIGNMENT_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)=(.*)", re.DOTALL)
+
+
+def _workflow_list(args, engine):
+    """Handle workflow --list"""
+    task_files = engine.list_task_files()
+    if args.json:
+        tasks = {}
+        for task_name, task_path in task_files.items():
+            try:
+                tasks[task_name] = {
+                    "description": _task_description(task_path),
+                    "file": task_path,
+                }
+            except Exception as e:
+                tasks[task_name] = {"file": task_path, "error": str(e)}
+        print(json.dumps(tasks, indent=2))
+        return 0
+
+    if not task_files:
+        print("No task files found in tasks/ directory")
+        return 0
+
+    out = io.StringIO()
+    log = functools.partial(print, file=out)
+
+    log("Available tasks:")
+    for task_name, task_path in task_files.items():
+        try:
+            description = _task_description(task_path)
+            log(f"  • {task_name} - {description}")
+            log(f"    File: {task_path}")
+            log()
+        except Exception as e:
+            log(f"  • {task_name} - Error reading task file: {e}")
+            log()
+    sys.stdout.write(out.getvalue())
+    return 0
+
+
+def _workflow_vars(args, engine):
+    """Handle workflow --vars [NAME]"""
+    if args.vars == "":
+        # Show all config variables
+        engine.show_available_variables()
+    else:
+        # Show variables for specific task (same as global since they come from config)
+        print(f"Variables available for task '{args.vars}':")
+        engine.show_available_variables()
+    return 0
+
+
+def _workflow_show(args, engine):
+    """Handle workflow --show NAME"""
+    try:
+        engine.show_task_info(args.show)
+        return 0
+    except Exception as e:
+        print(f"❌ Error showing task '{args.show}': {e}")
+        return 1
+
+
+def _workflow_exec(args, engine):
+    """Handle workflow --name NAME --exec"""
+    if not args.exec:
+        print("❌ --name requires --exec flag to execute the task")
+        return 1
+
+    # Parse runtime variables
+    runtime_vars = {}
+    for var_assignment in args.var or ():
+        match = _VAR_ASSIGNMENT_RE.match(var_assignment)
+        if not match:
+            print(
+                f"❌ Invalid variable format: {var_assignment} (expected KEY=VALUE)"
+            )
+            return 1
+        runtime_vars[match[1]] = match[2]
+
+    # Execute task
+    try:
+        print(f"🔄 Executing task: {args.name}")
+        if runtime_vars:
+            print(f"📋 Runtime variables: {runtime_vars}")
+        print()
+
+        success = engine.execute_task(args.name, runtime_vars, args.verbose)
+
+        if success:
+            print(f"\n✅ Task '{args.name}' completed successfully")
+            return 0
+        else:
+            print(f"\n❌ Task '{args.name}' failed")
+            return 1
+
+    except Exception as e:
+        print(f"❌ Error executing task '{args.name}': {e}")
+        if args.verbose:
+            import traceback
+
+            traceback.print_exc()
+        return 1
+
+
+# args.op (set by the workflow option flags) -> operation handler
+WORKFLOW_OPERATIONS = {
+    "list": _workflow_list,
+    "show": _workflow_show,
+    "vars": _workflow_vars,
+    "name": _workflow_exec,
+}
+
+
+def cmd_workflow(args):
+    """Handle workflow subcommand with multiple operations"""
+    try:
+        from ansible_engine import AnsibleEngine
+
+        operation = WORKFLOW_OPERATIONS.get(args.op)
+        if operation is None:
+            print(
+                "❌ No operation specified. Use --list, --show, --vars, or --name with --exec"
+            )
+            return 1
+
+        engine = AnsibleEngine()
+        return operation(args, engine)
+
+    except Exception as e:
+        print(f"❌ Error in task operation: {e}")
+        return 1
@@ -11,12 +11,65 @@ import logging
 import time
 import yaml
 import json
+import hashlib
+import pickle
 import re
 import shutil
+import threading
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Callable
 from dataclasses import dataclass
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Bump when the shape of anything stored through _cached_json changes so
+# stale .cache/ entries written by older versions are ignored
+CACHE_FORMAT_VERSION = "1"
+
+# Session-scoped transport settings applied to every git child process:
+# negotiate HTTP/2 with GitHub and use wire protocol v2 so fetches only
+# advertise the refs they ask for
+GIT_SESSION_CONFIG = {
+    "http.version": "HTTP/2",
+    "protocol.version": "2",
+}
+
+# get_all_manifests.sh COMPONENT_MANIFESTS entries, which look like
+# ["component"]="opendatahub-io:repo-name:ref-name:source-folder"
+MANIFEST_ENTRY_RE = re.compile(r'\["[^"]+"\]="opendatahub-io:([^:]+):([^:]+):[^"]+"')
+MANIFEST_SOURCE_ORG_RE = re.compile(r'(\["[^"]+"\]=")(opendatahub-io)(:)')
+
+
+def read_remote_urls(repo_path: Path) -> Dict[str, str]:
+    """
+    Return {remote name: url} for a checkout using one git config call
+
+    A remote with several url entries maps to the first one, which is the
+    URL git fetches from.
+
+    Args:
+        repo_path: Path to repository
+
+    Returns:
+        Dict mapping remote names to URLs (empty if there are none)
+    """
+    result = subprocess.run(
+        ["git", "config", "--get-regexp", r"^remote\..*\.url$"],
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+    )
+    remotes = {}
+    for line in result.stdout.splitlines():
+        key, _, url = line.partition(" ")
+        remotes.setdefault(key[len("remote."):-len(".url")], url)
+    return remotes
+
 
 @dataclass
 class RepoInfo:
@@ -37,6 +90,15 @@ class GitHubWrapper:
     cloning, and branch management.
     """
 
+    _git_env_configured = False
+
+    # GitHub rate-limit state shared by every wrapper in the process: API
+    # requests made before this time.time() value wait for the reset
+    _rate_limit_lock = threading.Lock()
+    _rate_limited_until = 0.0
+    _API_MAX_RETRIES = 3
+    _RATE_LIMIT_MAX_WAIT = 300
+
     def __init__(
         self,
         token_file: str = ".github_token",
@@ -69,7 +131,11 @@ class GitHubWrapper:
         self.config = self._load_config()
 
         # Load and set GitHub token
+        self._api_session = None
+        self._fork_exists_cache: Dict[str, bool] = {}
+        self._fork_list_complete = False
         self._load_github_token()
+        self._configure_git_env()
 
     def _setup_logging(self) -> logging.Logger:
         """Setup logging configuration"""
@@ -98,8 +164,7 @@ class GitHubWrapper:
             yaml.YAMLError: If config file has invalid YAML
         """
         try:
-            with open(self.config_file_path, "r") as f:
-                config = yaml.safe_load(f)
+            config = self._load_config_cached()
 
             self.logger.info(f"Configuration loaded from {self.config_file_path}")
             return config
@@ -111,6 +176,115 @@ class GitHubWrapper:
             self.logger.error(f"Failed to load configuration: {e}")
             raise
 
+    def _cached_json(
+        self, name: str, source_paths: List[Path], producer: Callable[[], Any]
+    ) -> Any:
+        """
+        Return producer() output, persisted under .cache/ keyed by source file stats
+
+        Only use this for values made of JSON-native types (dicts, lists,
+        strings, numbers, None) so warm and cold runs return the same thing.
+
+        Args:
+            name: Cache entry name (used as the file name prefix)
+            source_paths: Files the produced value is derived from
+            producer: Callable that computes the value on a cache miss
+
+        Returns:
+            The cached or freshly produced value
+        """
+        fingerprint = CACHE_FORMAT_VERSION.encode() + b"".join(
+            f"{p}:{p.stat().st_mtime_ns}:{p.stat().st_size}".encode()
+            for p in source_paths
+        )
+        key = hashlib.blake2b(fingerprint, digest_size=16).hexdigest()
+        cache_dir = self.project_root / ".cache"
+        cache_file = cache_dir / f"{name}-{key}.json"
+
+        try:
+            with open(cache_file, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        data = producer()
+
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_dir.mkdir(exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_file, cache_file)
+            for stale in cache_dir.glob(f"{name}-*.json"):
+                if stale != cache_file:
+                    stale.unlink(missing_ok=True)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not write cache {cache_file}: {e}")
+        finally:
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+        return data
+
+    def _load_config_cached(self) -> Any:
+        """
+        Parse config.yaml, reusing a pickled parse from an earlier run
+
+        The pickle lives in the user's cache directory (not the project tree)
+        and is keyed on the config file's path, mtime and size, so editing
+        the file invalidates it. Unlike the JSON sidecars, pickle keeps the
+        YAML types (dates, non-string keys) exactly as parsed.
+
+        Returns:
+            The parsed configuration
+        """
+        path = self.config_file_path.resolve()
+        stat = path.stat()
+        path_key = hashlib.blake2b(str(path).encode(), digest_size=8).hexdigest()
+        state_key = hashlib.blake2b(
+            f"{CACHE_FORMAT_VERSION}:{stat.st_mtime_ns}:{stat.st_size}".encode(),
+            digest_size=8,
+        ).hexdigest()
+        cache_dir = (
+            Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+            / "odh-tool"
+        )
+        cache_file = cache_dir / f"config-{path_key}-{state_key}.pkl"
+
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except Exception:  # missing, truncated or written by another version
+            pass
+
+        if not yaml.__with_libyaml__:
+            self.logger.warning(
+                "PyYAML is not built with libyaml; using the slower pure-Python loader"
+            )
+        with open(path, "r") as f:
+            config = yaml.load(f, Loader=SafeLoader)
+
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+            for stale in cache_dir.glob(f"config-{path_key}-*.pkl"):
+                if stale != cache_file:
+                    stale.unlink(missing_ok=True)
+        except (OSError, pickle.PicklingError) as e:
+            self.logger.debug(f"Could not write cache {cache_file}: {e}")
+        finally:
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+        return config
+
     def _find_config_file(self) -> Path:
         """
         Find the config file by searching up the directory tree
@@ -166,12 +340,170 @@ class GitHubWrapper:
 
             # Set environment variable for gh CLI
             os.environ["GITHUB_TOKEN"] = token
+            self._token = token
             self.logger.info("GitHub token loaded successfully")
 
         except Exception as e:
             self.logger.error(f"Failed to load GitHub token: {e}")
             raise
 
+    @classmethod
+    def _configure_git_env(cls) -> None:
+        """
+        Export the GIT_SESSION_CONFIG transport settings to git child
+        processes via GIT_CONFIG_COUNT
+
+        The settings only apply to processes started by this tool; the user's
+        git configuration files (including any credential helper) are left
+        untouched.
+        """
+        if cls._git_env_configured:
+            return
+
+        count = int(os.environ.get("GIT_CONFIG_COUNT", "0"))
+        for key, value in GIT_SESSION_CONFIG.items():
+            os.environ[f"GIT_CONFIG_KEY_{count}"] = key
+            os.environ[f"GIT_CONFIG_VALUE_{count}"] = value
+            count += 1
+        os.environ["GIT_CONFIG_COUNT"] = str(count)
+        cls._git_env_configured = True
+
+    def _get_api_session(self):
+        """
+        Get a keep-alive HTTP session authenticated with the GitHub token
+
+        requests is imported here, on first use, so commands that never call
+        the API do not pay for loading it.
+
+        Returns:
+            requests.Session, or None if requests is not installed
+        """
+        if self._api_session is None:
+            try:
+                import requests
+            except ImportError:  # fall back to the gh CLI for API calls
+                self._api_session = False
+            else:
+                session = requests.Session()
+                session.headers.update(
+                    {
+                        "Authorization": f"Bearer {self._token}",
+                        "Accept": "application/vnd.github+json",
+                    }
+                )
+                self._api_session = session
+
+        return self._api_session or None
+
+    def _api_request(self, session, method: str, url: str, **kwargs):
+        """
+        Send a GitHub API request, honouring the rate-limit headers
+
+        Waits while an earlier response reported the rate limit exhausted
+        (X-RateLimit-Remaining: 0 until X-RateLimit-Reset), and retries
+        rate-limited 403/429 responses after Retry-After or with exponential
+        backoff. Waits longer than _RATE_LIMIT_MAX_WAIT are not attempted;
+        the request is sent and its error response returned.
+
+        Args:
+            session: Session from _get_api_session()
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed to session.request()
+
+        Returns:
+            requests.Response of the last attempt
+        """
+        backoff = 1.0
+        for attempt in range(self._API_MAX_RETRIES + 1):
+            with self._rate_limit_lock:
+                wait = GitHubWrapper._rate_limited_until - time.time()
+            if 0 < wait <= self._RATE_LIMIT_MAX_WAIT:
+                self.logger.warning(f"GitHub rate limit reached, waiting {wait:.0f}s")
+                time.sleep(wait)
+
+            response = session.request(method, url, **kwargs)
+            headers = response.headers
+
+            exhausted = headers.get("X-RateLimit-Remaining") == "0"
+            if exhausted:
+                try:
+                    reset_at = float(headers.get("X-RateLimit-Reset", 0))
+                except ValueError:
+                    reset_at = 0.0
+                with self._rate_limit_lock:
+                    GitHubWrapper._rate_limited_until = max(
+                        GitHubWrapper._rate_limited_until, reset_at
+                    )
+
+            retry_after = headers.get("Retry-After")
+            rate_limited = response.status_code in (403, 429) and (
+                exhausted or retry_after is not None
+            )
+            if not rate_limited or attempt == self._API_MAX_RETRIES:
+                return response
+
+            # An exhausted primary limit is waited out at the top of the loop
+            if exhausted:
+                if GitHubWrapper._rate_limited_until - time.time() > self._RATE_LIMIT_MAX_WAIT:
+                    return response
+            else:
+                try:
+                    delay = max(float(retry_after), backoff)
+                except (TypeError, ValueError):
+                    delay = backoff
+                if delay > self._RATE_LIMIT_MAX_WAIT:
+                    return response
+                self.logger.warning(
+                    f"GitHub secondary rate limit hit, retrying in {delay:.0f}s"
+                )
+                time.sleep(delay)
+            backoff *= 2
+
+    def _graphql(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Run a GraphQL query against the GitHub API
+
+        Uses the shared HTTP session when available, otherwise 'gh api graphql'.
+
+        Args:
+            query: GraphQL query document
+
+        Returns:
+            The response's "data" object (may contain nulls for unresolved
+            nodes), or None if the request failed
+        """
+        session = self._get_api_session()
+        if session is not None:
+            import requests
+
+            try:
+                response = self._api_request(
+                    session, "POST", GITHUB_GRAPHQL_URL, json={"query": query}, timeout=60
+                )
+                response.raise_for_status()
+                return response.json().get("data")
+            except (requests.RequestException, ValueError) as e:
+                self.logger.warning(f"GraphQL request failed, retrying with gh: {e}")
+
+        try:
+            result = self._run_command(
+                ["gh", "api", "graphql", "-F", "query=@-"], input=query
+            )
+            output = result.stdout
+        except subprocess.CalledProcessError as e:
+            # Unresolved nodes are reported as GraphQL errors (non-zero
+            # exit) but the partial data is still printed
+            output = e.stdout
+        except OSError as e:
+            self.logger.warning(f"GraphQL request unavailable: {e}")
+            return None
+
+        try:
+            return json.loads(output or "")["data"]
+        except (ValueError, KeyError, TypeError):
+            return None
+
     def _find_token_file(self) -> Path:
         """
         Find the token file by searching up the directory tree
@@ -209,7 +541,12 @@ class GitHubWrapper:
         )
 
     def _run_command(
-        self, command: List[str], cwd: Optional[Path] = None
+        self,
+        command: List[str],
+        cwd: Optional[Path] = None,
+        input: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        capture: bool = True,
     ) -> subprocess.CompletedProcess:
         """
         Execute a command with proper error handling
@@ -217,6 +554,10 @@ class GitHubWrapper:
         Args:
             command: List of command arguments
             cwd: Working directory for command execution
+            input: Optional text passed to the command's stdin
+            env: Extra environment variables for the command
+            capture: Capture stdout; pass False for commands whose output is
+                unused (stderr is always kept for error reporting)
 
         Returns:
             CompletedProcess: Result of command execution
@@ -230,7 +571,14 @@ class GitHubWrapper:
 
         try:
             result = subprocess.run(
-                command, cwd=cwd, capture_output=True, text=True, check=True
+                command,
+                cwd=cwd,
+                input=input,
+                env={**os.environ, **env} if env else None,
+                stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True,
             )
 
             if result.stdout:
@@ -277,6 +625,7 @@ class GitHubWrapper:
             fork_command.append("--clone")
 
         self._run_command(fork_command, cwd=self.src_dir)
+        self._fork_exists_cache[name] = True
 
         repo_info = RepoInfo(
             owner=owner,
@@ -289,7 +638,12 @@ class GitHubWrapper:
         return repo_info
 
     def clone_repository(
-        self, repo_url: str, directory_name: Optional[str] = None
+        self,
+        repo_url: str,
+        directory_name: Optional[str] = None,
+        depth: Optional[int] = None,
+        filter_spec: Optional[str] = None,
+        branch: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Clone a repository to the src directory using SSH origin
@@ -297,6 +651,10 @@ class GitHubWrapper:
         Args:
             repo_url: GitHub repository URL (owner/repo format)
             directory_name: Custom directory name (defaults to repo name)
+            depth: Create a shallow clone truncated to this many commits
+            filter_spec: Partial clone filter (e.g. "blob:none" fetches file
+                contents lazily on checkout instead of for all history)
+            branch: Branch to check out instead of the remote HEAD
 
         Returns:
             Dict: Dictionary with 'cloned' (bool) and 'local_path' (str) keys
@@ -327,8 +685,16 @@ class GitHubWrapper:
         ssh_url = f"git@github.com:{repo_path}.git"
 
         # Clone the repository using SSH
-        clone_command = ["git", "clone", ssh_url, str(directory_name)]
-        self._run_command(clone_command, cwd=self.src_dir)
+        clone_command = ["git", "clone"]
+        if depth:
+            # Keep every branch head so origin/<feature> refs stay visible
+            clone_command.extend(["--depth", str(depth), "--no-single-branch"])
+        if filter_spec:
+            clone_command.append(f"--filter={filter_spec}")
+        if branch:
+            clone_command.extend(["--branch", branch])
+        clone_command.extend([ssh_url, str(directory_name)])
+        self._run_command(clone_command, cwd=self.src_dir, capture=False)
 
         self.logger.info(f"Repository cloned to: {clone_path}")
         return {
@@ -354,14 +720,57 @@ class GitHubWrapper:
         self._run_command(
             ["git", "checkout", "-B", base_branch, f"origin/{base_branch}"],
             cwd=repo_path,
+            capture=False,
         )
-        self._run_command(["git", "pull", "origin", base_branch], cwd=repo_path)
+        self._run_command(["git", "pull", "origin", base_branch], cwd=repo_path, capture=False)
 
         # Create and checkout new branch (use -B to allow recreating existing branch)
-        self._run_command(["git", "checkout", "-B", branch_name], cwd=repo_path)
+        self._run_command(["git", "checkout", "-B", branch_name], cwd=repo_path, capture=False)
 
         self.logger.info(f"Branch '{branch_name}' created successfully")
 
+    # Fetch origin, switch to $FB (creating a tracking branch if it only
+    # exists on origin) and pull it, all in one process
+    _UPDATE_BRANCH_SCRIPT = """
+set -e
+git fetch origin
+if [ "$(git symbolic-ref --short -q HEAD)" != "$FB" ]; then
+    if ! git checkout "$FB"; then
+        exec git checkout --track "origin/$FB"
+    fi
+fi
+git pull origin "$FB"
+"""
+
+    def update_feature_branch(self, repo_path: Path, feature_branch: str) -> None:
+        """
+        Check out an existing feature branch and bring it up to date with origin
+
+        Args:
+            repo_path: Path to local repository
+            feature_branch: Branch to check out and pull
+
+        Raises:
+            RuntimeError: If the branch could not be checked out or pulled
+        """
+        self.logger.info(f"Updating branch '{feature_branch}' in {repo_path}")
+
+        try:
+            # The branch name is passed through the environment, never
+            # interpolated into the script
+            self._run_command(
+                ["sh", "-c", self._UPDATE_BRANCH_SCRIPT],
+                cwd=repo_path,
+                env={"FB": feature_branch},
+                capture=False,
+            )
+        except subprocess.CalledProcessError as e:
+            detail = (e.stderr or "").strip().splitlines()
+            raise RuntimeError(
+                f"Failed to update branch '{feature_branch}': "
+                f"{detail[-1] if detail else f'exit status {e.returncode}'}"
+            ) from e
+
     def setup_upstream(self, repo_path: Path, upstream_url: str) -> None:
         """
         Setup upstream remote for a forked repository
@@ -372,31 +781,36 @@ class GitHubWrapper:
         """
         self.logger.info(f"Setting up upstream remote: {upstream_url}")
 
-        # Check if upstream remote already exists
+        # A single config read tells us whether the remote exists and where
+        # it points
+        result = self._run_command(
+            ["git", "config", "--default", "", "--get", "remote.upstream.url"],
+            cwd=repo_path,
+        )
+        current_url = result.stdout.strip()
+
         try:
-            result = self._run_command(["git", "remote"], cwd=repo_path)
-            existing_remotes = result.stdout.strip().split('\n')
-            
-            if "upstream" not in existing_remotes:
+            if not current_url:
                 # Add upstream remote
                 self._run_command(
                     ["git", "remote", "add", "upstream", upstream_url], cwd=repo_path
                 )
                 self.logger.info("Upstream remote added")
-            else:
-                self.logger.info("Upstream remote already exists")
+            elif current_url != upstream_url:
                 # Update the upstream URL in case it changed
                 self._run_command(
                     ["git", "remote", "set-url", "upstream", upstream_url], cwd=repo_path
                 )
                 self.logger.info("Upstream remote URL updated")
-        
+            else:
+                self.logger.info("Upstream remote already exists")
+
         except Exception as e:
             self.logger.error(f"Failed to check/setup upstream remote: {e}")
             raise
 
         # Fetch upstream (always do this to get latest changes)
-        self._run_command(["git", "fetch", "upstream"], cwd=repo_path)
+        self._run_command(["git", "fetch", "upstream"], cwd=repo_path, capture=False)
 
         self.logger.info("Upstream remote configured successfully")
 
@@ -425,13 +839,22 @@ class GitHubWrapper:
 
         return json.loads(result.stdout)
 
-    def list_repositories(self, owner: str, limit: int = 30) -> List[Dict[str, Any]]:
+    def list_repositories(
+        self,
+        owner: str,
+        limit: int = 30,
+        fields: Tuple[str, ...] = ("name", "owner", "url", "defaultBranch", "isPrivate"),
+    ) -> List[Dict[str, Any]]:
         """
         List repositories for a given owner
 
+        gh pages through the GraphQL API itself and only requests the given
+        fields, so asking for fewer fields makes large listings cheaper.
+
         Args:
             owner: GitHub username or organization
             limit: Maximum number of repositories to return
+            fields: Repository fields to include in each dictionary
 
         Returns:
             List of repository information dictionaries
@@ -447,12 +870,56 @@ class GitHubWrapper:
                 "--limit",
                 str(limit),
                 "--json",
-                "name,owner,url,defaultBranch,isPrivate",
+                ",".join(fields),
             ]
         )
 
         return json.loads(result.stdout)
 
+    def batch_repo_state(
+        self, repos: List[Tuple[str, str, str]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up several repositories and a branch in each with one GraphQL request
+
+        Args:
+            repos: (owner, name, branch) tuples to query
+
+        Returns:
+            Dict mapping "owner/name" to a dict with keys "exists",
+            "default_branch" and "has_branch". Returns an empty dict if the
+            query could not be made, so callers should fall back to git.
+        """
+        if not repos:
+            return {}
+
+        fields = []
+        for i, (owner, name, branch) in enumerate(repos):
+            fields.append(
+                f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+                f"{{ defaultBranchRef {{ name }} "
+                f"branch: ref(qualifiedName: {json.dumps('refs/heads/' + branch)}) {{ name }} }}"
+            )
+        query = "query {\n  " + "\n  ".join(fields) + "\n}"
+
+        self.logger.info(f"Querying state of {len(repos)} repositories via GraphQL")
+
+        data = self._graphql(query)
+        if data is None:
+            self.logger.warning("GraphQL repository lookup returned no data")
+            return {}
+
+        states = {}
+        for i, (owner, name, branch) in enumerate(repos):
+            repo = data.get(f"r{i}")
+            states[f"{owner}/{name}"] = {
+                "exists": repo is not None,
+                "default_branch": ((repo or {}).get("defaultBranchRef") or {}).get("name"),
+                "has_branch": bool(repo and repo.get("branch")),
+            }
+
+        return states
+
     def whoami(self) -> Dict[str, Any]:
         """
         Check authentication status and get current user information
@@ -499,6 +966,14 @@ class GitHubWrapper:
         - branch: "branch_name" or None for default branch
         - repo_name: "repo" (name for the fork)
         """
+        return self._cached_json(
+            "additional-repositories",
+            [self.config_file_path],
+            self._parse_additional_repositories,
+        )
+
+    def _parse_additional_repositories(self) -> List[Dict[str, Optional[str]]]:
+        """Parse additional repositories from configuration (uncached)"""
         additional_repos = self.get_additional_repositories()
         parsed_repos = []
         
@@ -596,22 +1071,95 @@ class GitHubWrapper:
         Returns:
             bool: True if fork exists, False otherwise
         """
-        try:
-            fork_org = self.get_fork_org()
-            owner, name = repo_path.split("/")
-            fork_path = f"{fork_org}/{name}"
+        fork_org = self.get_fork_org()
+        owner, name = repo_path.split("/")
+        fork_path = f"{fork_org}/{name}"
 
+        if name in self._fork_exists_cache:
+            return self._fork_exists_cache[name]
+        if self._fork_list_complete:
+            return False
+
+        try:
             self.logger.info(f"Checking if fork exists: {fork_path}")
 
             # Try to get repository info - if it fails, fork doesn't exist
             self._run_command(["gh", "repo", "view", fork_path, "--json", "name"])
 
             self.logger.info(f"Fork exists: {fork_path}")
-            return True
+            exists = True
 
         except subprocess.CalledProcessError:
             self.logger.info(f"Fork does not exist: {fork_path}")
+            exists = False
+
+        self._fork_exists_cache[name] = exists
+        return exists
+
+    def load_fork_list(self, limit: int = 1000) -> None:
+        """
+        Record every repository in the fork organization with one listing call
+
+        Later fork_exists() calls are answered from this list instead of
+        querying GitHub once per repository.
+
+        Args:
+            limit: Maximum number of repositories to list
+        """
+        fork_org = self.get_fork_org()
+        repos = self.list_repositories(fork_org, limit=limit, fields=("name",))
+        names = {repo["name"] for repo in repos}
+
+        self._fork_exists_cache.update(dict.fromkeys(names, True))
+        # A truncated listing can only answer positively
+        self._fork_list_complete = len(repos) < limit
+
+    def wait_for_fork_ready(self, repo_name: str, timeout: float = 30) -> bool:
+        """
+        Wait until a freshly created fork can be cloned
+
+        GitHub creates the fork's repository record immediately but copies
+        the git data asynchronously, so readiness is checked with
+        git ls-remote (the fork must advertise at least one branch) rather
+        than through the API. Polls with exponential backoff (0.25s, 0.5s,
+        1s, ...) instead of sleeping for a fixed time.
+
+        Args:
+            repo_name: Repository name within the fork organization
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            bool: True once the fork is available, False on timeout
+        """
+        fork_path = f"{self.get_fork_org()}/{repo_name}"
+        deadline = time.monotonic() + timeout
+        delay = 0.25
+
+        while True:
+            if self._repository_has_branches(fork_path):
+                self.logger.info(f"Fork is ready: {fork_path}")
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.logger.warning(f"Timed out waiting for fork {fork_path}")
+                return False
+
+            time.sleep(min(delay, remaining))
+            delay *= 2
+
+    def _repository_has_branches(self, repo_path: str) -> bool:
+        """Check whether git ls-remote lists any branch for a repository"""
+        try:
+            result = subprocess.run(
+                ["git", "ls-remote", "--heads", f"git@github.com:{repo_path}.git"],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except (OSError, subprocess.TimeoutExpired):
             return False
+        return result.returncode == 0 and bool(result.stdout.strip())
 
     def local_checkout_exists(self, repo_name: str) -> bool:
         """
@@ -645,12 +1193,13 @@ class GitHubWrapper:
         self.logger.info(f"Rebasing {repo_path} from upstream/{base_branch}")
 
         # Fetch upstream
-        self._run_command(["git", "fetch", "upstream"], cwd=repo_path)
+        self._run_command(["git", "fetch", "upstream"], cwd=repo_path, capture=False)
 
         # Checkout base branch using explicit origin reference to avoid ambiguity
         self._run_command(
             ["git", "checkout", "-B", base_branch, f"origin/{base_branch}"],
             cwd=repo_path,
+            capture=False,
         )
 
         # Rebase from upstream
@@ -661,6 +1210,30 @@ class GitHubWrapper:
 
         self.logger.info(f"Successfully rebased from upstream/{base_branch}")
 
+    def get_current_branch(self, repo_path: Path) -> str:
+        """
+        Get the branch currently checked out in a repository
+
+        Reads .git/HEAD directly, falling back to git for layouts such as
+        worktrees where .git is not a directory.
+
+        Args:
+            repo_path: Path to local repository
+
+        Returns:
+            str: Branch name, or an empty string for a detached HEAD
+        """
+        try:
+            head = (Path(repo_path) / ".git" / "HEAD").read_text().strip()
+        except OSError:
+            result = self._run_command(
+                ["git", "branch", "--show-current"], cwd=repo_path
+            )
+            return result.stdout.strip()
+
+        prefix = "ref: refs/heads/"
+        return head[len(prefix):] if head.startswith(prefix) else ""
+
     def branch_exists(self, repo_path: Path, branch_name: str) -> bool:
         """
         Check if a branch exists locally or remotely in the repository
@@ -672,18 +1245,18 @@ class GitHubWrapper:
         Returns:
             bool: True if branch exists locally or on origin, False otherwise
         """
-        try:
-            # Check local branches first
-            result = self._run_command(
-                ["git", "branch", "--list", branch_name], cwd=repo_path
-            )
-            local_exists = bool(result.stdout.strip())
+        local_ref = f"refs/heads/{branch_name}"
+        remote_ref = f"refs/remotes/origin/{branch_name}"
 
-            # Check remote branches
+        try:
+            # One for-each-ref answers both the local and the remote check
             result = self._run_command(
-                ["git", "branch", "-r", "--list", f"origin/{branch_name}"], cwd=repo_path
+                ["git", "for-each-ref", "--format=%(refname)", local_ref, remote_ref],
+                cwd=repo_path,
             )
-            remote_exists = bool(result.stdout.strip())
+            refs = set(result.stdout.split())
+            local_exists = local_ref in refs
+            remote_exists = remote_ref in refs
 
             exists = local_exists or remote_exists
 
@@ -716,21 +1289,29 @@ class GitHubWrapper:
         with open(manifest_script, "r") as f:
             content = f.read()
 
+        # Replace opendatahub-io with fork organization in the COMPONENT_MANIFESTS array
+        replacement = rf"\1{fork_org}\3"
+
+        updated_content = MANIFEST_SOURCE_ORG_RE.sub(replacement, content)
+
+        # Nothing to rewrite (already pointing at the fork org); also keeps an
+        # existing backup of the original script from being overwritten
+        if updated_content == content:
+            self.logger.info(f"{manifest_script} already uses {fork_org}, no changes needed")
+            return
+
         # Create a backup
         backup_script = operator_path / "get_all_manifests.sh.backup"
         with open(backup_script, "w") as f:
             f.write(content)
 
-        # Replace opendatahub-io with fork organization in the COMPONENT_MANIFESTS array
-        # Pattern to match lines like: ["component"]="opendatahub-io:repo:ref:path"
-        pattern = r'(\["[^"]+"\]=")(opendatahub-io)(:)'
-        replacement = rf"\1{fork_org}\3"
-
-        updated_content = re.sub(pattern, replacement, content)
-
-        # Write the updated script
-        with open(manifest_script, "w") as f:
+        # Write the updated script via a temp file so an interrupted run can
+        # never leave a truncated get_all_manifests.sh behind
+        tmp_script = manifest_script.with_name(manifest_script.name + ".tmp")
+        with open(tmp_script, "w") as f:
             f.write(updated_content)
+        shutil.copymode(manifest_script, tmp_script)
+        os.replace(tmp_script, manifest_script)
 
         self.logger.info(f"Updated {manifest_script} to use {fork_org} organization")
         self.logger.info(f"Backup saved as {backup_script}")
@@ -766,6 +1347,19 @@ class GitHubWrapper:
                 f"get_all_manifests.sh not found at {manifest_script}"
             )
 
+        repo_branches = self._cached_json(
+            "manifests",
+            [manifest_script],
+            lambda: self._parse_manifest_script(manifest_script),
+        )
+
+        self.logger.info(
+            f"Found {len(repo_branches)} repositories with branches in get_all_manifests.sh"
+        )
+        return repo_branches
+
+    def _parse_manifest_script(self, manifest_script: Path) -> Dict[str, str]:
+        """Extract repository names and branches from get_all_manifests.sh (uncached)"""
         repo_branches = {}
 
         with open(manifest_script, "r") as f:
@@ -788,19 +1382,15 @@ class GitHubWrapper:
         array_content = content[array_start : array_end + 1]
 
         # Extract repository names and branches from the array content only
-        pattern = r'\["[^"]+"\]="opendatahub-io:([^:]+):([^:]+):[^"]+"'
-        matches = re.findall(pattern, array_content)
+        matches = MANIFEST_ENTRY_RE.findall(array_content)
 
         for repo_name, branch_name in matches:
             repo_branches[repo_name] = branch_name
 
-        self.logger.info(
-            f"Found {len(repo_branches)} repositories with branches in get_all_manifests.sh"
-        )
         return repo_branches
 
     def setup_manifest_repository(
-        self, repo_name: str, base_branch: str = None
+        self, repo_name: str, base_branch: str = None, raise_errors: bool = False
     ) -> bool:
         """
         Ensure a manifest repository is forked, cloned, and has feature branch
@@ -808,6 +1398,8 @@ class GitHubWrapper:
         Args:
             repo_name: Repository name (e.g., "odh-dashboard")
             base_branch: Base branch to use (from get_all_manifests.sh)
+            raise_errors: Re-raise the failure (after logging it) instead of
+                returning False, so callers can report the cause
 
         Returns:
             bool: True if setup successful, False if errors occurred
@@ -835,8 +1427,7 @@ class GitHubWrapper:
                     self.fork_repository(original_repo, clone_after_fork=False)
                     fork_created = True
                 except Exception as e:
-                    self.logger.error(f"Failed to fork {original_repo}: {e}")
-                    return False
+                    raise RuntimeError(f"Failed to fork {original_repo}: {e}") from e
             else:
                 self.logger.info(f"Fork already exists for {original_repo}")
 
@@ -844,10 +1435,13 @@ class GitHubWrapper:
             if not self.local_checkout_exists(repo_name):
                 self.logger.info(f"Local checkout doesn't exist, cloning {repo_name}")
                 try:
-                    # Add delay if we just created the fork to avoid race condition
+                    # A just-created fork may not be cloneable immediately
                     if fork_created:
-                        self.logger.info("Waiting 3 seconds for fork to be ready...")
-                        time.sleep(3)
+                        self.logger.info("Waiting for fork to be ready...")
+                        if not self.wait_for_fork_ready(repo_name):
+                            raise RuntimeError(
+                                f"fork {fork_org}/{repo_name} was not ready to clone in time"
+                            )
 
                     fork_repo = f"{fork_org}/{repo_name}"
                     clone_result = self.clone_repository(fork_repo, repo_name)
@@ -858,8 +1452,7 @@ class GitHubWrapper:
                     self.setup_upstream(clone_path, upstream_url)
 
                 except Exception as e:
-                    self.logger.error(f"Failed to clone {repo_name}: {e}")
-                    return False
+                    raise RuntimeError(f"Failed to clone {repo_name}: {e}") from e
             else:
                 self.logger.info(f"Local checkout already exists for {repo_name}")
 
@@ -877,10 +1470,9 @@ class GitHubWrapper:
                     self.create_branch(repo_path, branch_name, base_branch)
 
                 except Exception as e:
-                    self.logger.error(
+                    raise RuntimeError(
                         f"Failed to create branch {branch_name} in {repo_name}: {e}"
-                    )
-                    return False
+                    ) from e
             else:
                 self.logger.info(
                     f"Feature branch {branch_name} already exists in {repo_name}"
@@ -890,6 +1482,8 @@ class GitHubWrapper:
 
         except Exception as e:
             self.logger.error(f"Error setting up {repo_name}: {e}")
+            if raise_errors:
+                raise
             return False
 
     def get_repository_status(self, repo_path: Path) -> Dict[str, Any]:
@@ -969,20 +1563,7 @@ class GitHubWrapper:
             Dict mapping remote names to URLs
         """
         try:
-            result = self._run_command(["git", "remote", "-v"], cwd=repo_path)
-            remotes = {}
-
-            for line in result.stdout.strip().split("\n"):
-                if line.strip():
-                    parts = line.strip().split()
-                    if len(parts) >= 2:
-                        remote_name = parts[0]
-                        remote_url = parts[1]
-                        # Only capture fetch URLs (skip push URLs which are duplicates)
-                        if len(parts) == 2 or parts[2] == "(fetch)":
-                            remotes[remote_name] = remote_url
-
-            return remotes
+            return read_remote_urls(repo_path)
 
         except Exception as e:
             self.logger.error(f"Error getting remote URLs for {repo_path}: {e}")
@@ -998,10 +1579,12 @@ class GitHubWrapper:
         if not self.src_dir.exists():
             return []
 
-        repos = []
-        for item in self.src_dir.iterdir():
-            if item.is_dir() and (item / ".git").exists():
-                repos.append(item.name)
+        with os.scandir(self.src_dir) as entries:
+            repos = [
+                entry.name
+                for entry in entries
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, ".git"))
+            ]
 
         return sorted(repos)
 
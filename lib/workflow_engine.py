@@ -6,6 +6,11 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 
 @dataclass
 class WorkflowStep:
@@ -70,7 +75,7 @@ class WorkflowEngine:
 
         try:
             with open(self.config_file, "r") as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=SafeLoader) or {}
         except Exception as e:
             print(f"Warning: Could not load config file {self.config_file}: {e}")
             return {}
@@ -160,7 +165,7 @@ class WorkflowEngine:
             raise FileNotFoundError(f"Workflow file not found: {workflow_file}")
 
         with open(workflow_file, "r") as f:
-            workflow_data = yaml.safe_load(f)
+            workflow_data = yaml.load(f, Loader=SafeLoader)
 
         # Track this workflow as being loaded
         loaded_workflows.add(workflow_name)